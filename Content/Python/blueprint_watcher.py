@@ -11,11 +11,35 @@ Or set to auto-run in Project Settings > Python > Startup Scripts
 """
 
 import unreal
+import hashlib
+import io
 import json
 import os
+import threading
+from collections import ChainMap, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, TextIO, Tuple
+
+# Optional faster JSON backend. Install into UE's bundled Python with:
+#   <UE>/Engine/Binaries/ThirdParty/Python3/<Platform>/python -m pip install orjson
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional serializers for EXTRA_OUTPUT_FORMATS
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 # ============================================================================
 # CONFIGURATION
@@ -33,27 +57,99 @@ GENERATE_MARKDOWN = True
 # Whether to include detailed node information (if C++ plugin available)
 INCLUDE_GRAPH_NODES = True  # C++ plugin is now installed and compiled
 
+# Additional formats written next to the JSON/Markdown, e.g. ("yaml", "msgpack").
+# YAML is a compact, LLM-friendly alternative to indented JSON and needs PyYAML;
+# MessagePack is a binary machine format and needs msgpack.
+EXTRA_OUTPUT_FORMATS: Tuple[str, ...] = ()
+
+# When graph nodes aren't exported (INCLUDE_GRAPH_NODES off or plugin missing),
+# read blueprint metadata from AssetRegistry tags instead of loading every
+# blueprint. Much faster on large projects, but components are omitted since
+# they need the loaded class. Falls back to loading when tags are missing.
+METADATA_FROM_REGISTRY = False
+
+# Whether to pretty-print JSON exports (indented). Compact output uses the
+# C-accelerated encoder (or orjson, if installed) and is roughly half the
+# size on disk. Applies to JSON-only exports too: the C++ plugin's condensed
+# output is written as-is when this is off and re-indented when it is on.
+PRETTY_JSON = False
+
+# Worker threads used to serialize and write export files. UE API calls
+# always stay on the main thread; only pure-Python work is handed off.
+EXPORT_WORKERS = 4
+
+# Maximum number of extracted blueprints waiting to be written. Extraction
+# pauses when this many are queued, which bounds memory on large projects.
+MAX_PENDING_EXPORTS = 32
+
+# Upper bound on steps traced per execution chain in the markdown output.
+# Cycles are already detected, so this only guards against runaway output.
+MAX_CHAIN_DEPTH = 10_000
+
+# Skip blueprints whose .uasset is unchanged since the last export
+# (tracked in OUTPUT_DIR/.manifest.json). Everything is re-exported when the
+# C++ plugin becomes available or the graph/JSON settings change. Use
+# export_all_blueprints(force=True) or delete the manifest to re-export everything.
+INCREMENTAL_EXPORT = True
+
+# Manifest file name (inside OUTPUT_DIR)
+MANIFEST_FILE = ".manifest.json"
+
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# Output root, resolved once per export run by ensure_output_dir()
+_OUTPUT_ROOT: Optional[str] = None
+
+# Directories already created this export run (skips repeated makedirs calls)
+_CREATED_DIRS: Set[str] = set()
+
+# Buffer size for streamed output files, so rendering many small fragments
+# doesn't turn into many small write() syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Timestamp shared by every file written during export_all_blueprints()
+_EXPORT_TIMESTAMP: Optional[str] = None
+
+
+@lru_cache(maxsize=1)
 def get_project_root():
     """Get the project root directory"""
     return unreal.SystemLibrary.get_project_directory()
 
 
+def get_export_timestamp() -> str:
+    """Get the current export run's timestamp (or now, outside of a run)"""
+    return _EXPORT_TIMESTAMP or datetime.now().isoformat()
+
+
 def ensure_output_dir():
     """Create output directory if it doesn't exist"""
-    output_path = os.path.join(get_project_root(), OUTPUT_DIR)
-    os.makedirs(output_path, exist_ok=True)
-    return output_path
+    global _OUTPUT_ROOT
+    if _OUTPUT_ROOT is None:
+        output_path = os.path.normpath(os.path.join(get_project_root(), OUTPUT_DIR))
+        os.makedirs(output_path, exist_ok=True)
+        _CREATED_DIRS.add(output_path)
+        _OUTPUT_ROOT = output_path
+    return _OUTPUT_ROOT
 
 
-def get_output_path(blueprint_path: str, extension: str) -> str:
+def reset_output_dirs():
     """
-    Convert blueprint path to output file path
-    /Game/Characters/BP_Player -> ClaudeCodeDocs/Blueprints/Characters/BP_Player.json
+    Forget the output directories created so far, so the next export
+    recreates any that were deleted while the editor was running
+    """
+    global _OUTPUT_ROOT
+    _OUTPUT_ROOT = None
+    _CREATED_DIRS.clear()
+
+
+def get_output_paths(blueprint_path: str, extensions: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Convert blueprint path to output file paths, one per extension
+    /Game/Characters/BP_Player -> ClaudeCodeDocs/Blueprints/Characters/BP_Player.json, ...
     """
     output_root = ensure_output_dir()
 
@@ -62,14 +158,110 @@ def get_output_path(blueprint_path: str, extension: str) -> str:
 
     # Split into directory and filename
     parts = relative_path.split("/")
-    filename = parts[-1] + extension
+    filename = parts[-1]
     subdirs = parts[:-1]
 
     # Create subdirectory structure
     subdir_path = os.path.join(output_root, *subdirs)
-    os.makedirs(subdir_path, exist_ok=True)
+    if subdir_path not in _CREATED_DIRS:
+        os.makedirs(subdir_path, exist_ok=True)
+        _CREATED_DIRS.add(subdir_path)
 
-    return os.path.join(subdir_path, filename)
+    return {ext: os.path.join(subdir_path, filename + ext) for ext in extensions}
+
+
+def get_output_path(blueprint_path: str, extension: str) -> str:
+    """
+    Convert blueprint path to output file path
+    /Game/Characters/BP_Player -> ClaudeCodeDocs/Blueprints/Characters/BP_Player.json
+    """
+    return get_output_paths(blueprint_path, (extension,))[extension]
+
+
+def write_bytes_atomic(path: str, data: bytes):
+    """Write bytes to a temp file next to path and rename it over path"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_yaml(data: Any, path: str):
+    """Write data as YAML (uses the libyaml C dumper when available)"""
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    with open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+        yaml.dump(data, f, Dumper=dumper, sort_keys=False, allow_unicode=True)
+
+
+def write_msgpack(data: Any, path: str):
+    """Write data as MessagePack"""
+    with open(path, 'wb') as f:
+        f.write(msgpack.packb(data))
+
+
+# Extra output format -> (file extension, writer, backing module)
+_EXTRA_FORMAT_WRITERS = {
+    "yaml": (".yaml", write_yaml, yaml),
+    "msgpack": (".msgpack", write_msgpack, msgpack),
+}
+
+
+def get_extra_formats() -> List[str]:
+    """Get the EXTRA_OUTPUT_FORMATS that are known and have their module installed"""
+    formats = []
+    for fmt in EXTRA_OUTPUT_FORMATS:
+        writer = _EXTRA_FORMAT_WRITERS.get(fmt)
+        if writer is None:
+            unreal.log_warning(f"Unknown output format: {fmt}")
+        elif writer[2] is None:
+            unreal.log_warning(f"Output format '{fmt}' requires the {fmt} Python module")
+        else:
+            formats.append(fmt)
+    return formats
+
+
+def collect_outputs(root: str) -> Tuple[List[str], List[str]]:
+    """
+    Collect exported (json_paths, md_paths) under root in a single walk
+    Index files and dotfiles (e.g. the manifest) are skipped. Uses os.scandir
+    so directory entries don't need a separate stat call.
+    """
+    json_paths, md_paths = [], []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif name.startswith('.'):
+                    continue
+                elif name.endswith('.json'):
+                    if name != 'index.json':
+                        json_paths.append(entry.path)
+                elif name.endswith('.md'):
+                    if name != 'index.md':
+                        md_paths.append(entry.path)
+    return json_paths, md_paths
+
+
+def loads_json(text: str) -> Any:
+    """Parse a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, honoring PRETTY_JSON, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if PRETTY_JSON:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if PRETTY_JSON:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=True).encode('utf-8')
 
 
 # ============================================================================
@@ -85,7 +277,7 @@ def extract_blueprint_metadata(blueprint: unreal.Blueprint) -> Dict[str, Any]:
         "name": blueprint.get_name(),
         "path": blueprint.get_path_name(),
         "class_type": "Blueprint",
-        "exported_at": datetime.now().isoformat(),
+        "exported_at": get_export_timestamp(),
         "parent_class": None,
         "variables": [],
         "functions": [],
@@ -95,8 +287,9 @@ def extract_blueprint_metadata(blueprint: unreal.Blueprint) -> Dict[str, Any]:
     }
 
     # Get parent class
-    if hasattr(blueprint, 'parent_class') and blueprint.parent_class:
-        data["parent_class"] = blueprint.parent_class.get_name()
+    parent_class = getattr(blueprint, 'parent_class', None)
+    if parent_class:
+        data["parent_class"] = parent_class.get_name()
 
     # Get generated class
     generated_class = blueprint.generated_class()
@@ -109,17 +302,59 @@ def extract_blueprint_metadata(blueprint: unreal.Blueprint) -> Dict[str, Any]:
             data["components"] = extract_components(cdo)
 
     # Get blueprint description/category if available
-    if hasattr(blueprint, 'blueprint_description'):
-        data["metadata"]["description"] = blueprint.blueprint_description
+    description = getattr(blueprint, 'blueprint_description', None)
+    if description is not None:
+        data["metadata"]["description"] = description
 
     # Get implemented interfaces
-    if hasattr(blueprint, 'implemented_interfaces'):
-        for interface in blueprint.implemented_interfaces:
+    interfaces = getattr(blueprint, 'implemented_interfaces', None)
+    if interfaces:
+        for interface in interfaces:
             data["interfaces"].append(interface.get_name())
 
     return data
 
 
+def parse_class_tag(value: str) -> str:
+    """
+    Get the class name from an AssetRegistry class tag value
+    /Script/CoreUObject.Class'/Script/Engine.Character' -> Character
+    """
+    return value.rstrip("'").rsplit(".", 1)[-1]
+
+
+def extract_from_asset_data(asset_data) -> Optional[Dict[str, Any]]:
+    """
+    Extract blueprint metadata from AssetRegistry tags without loading the asset
+    Returns None if the required tags are missing (caller should load the asset)
+    Note: components aren't available from tags
+    """
+    parent_class = asset_data.get_tag_value("ParentClass")
+    generated_class = asset_data.get_tag_value("GeneratedClass")
+    if not parent_class or not generated_class:
+        return None
+
+    data = {
+        "name": str(asset_data.asset_name),
+        "path": f"{asset_data.package_name}.{asset_data.asset_name}",
+        "class_type": "Blueprint",
+        "exported_at": get_export_timestamp(),
+        "parent_class": parse_class_tag(parent_class),
+        "generated_class": parse_class_tag(generated_class),
+        "variables": [],
+        "functions": [],
+        "components": [],
+        "interfaces": [],
+        "metadata": {}
+    }
+
+    description = asset_data.get_tag_value("BlueprintDescription")
+    if description:
+        data["metadata"]["description"] = description
+
+    return data
+
+
 def extract_components(cdo) -> List[Dict[str, str]]:
     """Extract component information from blueprint CDO"""
     components = []
@@ -141,24 +376,43 @@ def extract_components(cdo) -> List[Dict[str, str]]:
 # BLUEPRINT DATA EXTRACTION (C++ Plugin - Optional)
 # ============================================================================
 
+# C++ plugin entry point, resolved once at import (None if the plugin isn't loaded)
+_BP_EXPORT_FN = getattr(getattr(unreal, 'BlueprintExporterLibrary', None), 'extract_blueprint_data', None)
+
+if INCLUDE_GRAPH_NODES and _BP_EXPORT_FN is None:
+    unreal.log_warning("BlueprintExporter plugin not found")
+    unreal.log_warning("Falling back to metadata-only export")
+
+
+def extract_blueprint_json(blueprint: unreal.Blueprint) -> Optional[str]:
+    """
+    Get the raw JSON string produced by the BlueprintExporter C++ plugin
+    Returns None if graph nodes are disabled or the plugin is unavailable
+    """
+    if not INCLUDE_GRAPH_NODES or _BP_EXPORT_FN is None:
+        return None
+
+    try:
+        # Call the C++ plugin function
+        return _BP_EXPORT_FN(blueprint)
+    except Exception as e:
+        unreal.log_error(f"Error extracting blueprint data: {e}")
+        return None
+
+
 def extract_blueprint_data_full(blueprint: unreal.Blueprint) -> Dict[str, Any]:
     """
     Extract full blueprint data including graph nodes
     Requires BlueprintExporter C++ plugin
     """
-    if INCLUDE_GRAPH_NODES:
-        try:
-            # Call the C++ plugin function
-            json_string = unreal.BlueprintExporterLibrary.extract_blueprint_data(blueprint)
-            return json.loads(json_string)
-        except AttributeError as e:
-            unreal.log_warning(f"BlueprintExporter plugin not found: {e}")
-            unreal.log_warning("Falling back to metadata-only export")
-            return extract_blueprint_metadata(blueprint)
-        except Exception as e:
-            unreal.log_error(f"Error extracting blueprint data: {e}")
-            return extract_blueprint_metadata(blueprint)
-    else:
+    json_string = extract_blueprint_json(blueprint)
+    if json_string is None:
+        return extract_blueprint_metadata(blueprint)
+
+    try:
+        return loads_json(json_string)
+    except ValueError as e:
+        unreal.log_error(f"Error parsing blueprint data: {e}")
         return extract_blueprint_metadata(blueprint)
 
 
@@ -166,102 +420,159 @@ def extract_blueprint_data_full(blueprint: unreal.Blueprint) -> Dict[str, Any]:
 # MARKDOWN GENERATION
 # ============================================================================
 
+# Blueprint markdown header, filled with str.format_map()
+_MD_HEADER = (
+    "# {name}\n\n"
+    "**Type:** {class_type}\n"
+    "**Path:** `{path}`\n"
+    "**Parent Class:** {parent_class}\n"
+    "**Exported:** {exported_at}\n\n"
+)
+
+# Values used for header fields missing from the blueprint data
+_MD_HEADER_DEFAULTS = {
+    "class_type": "Blueprint",
+    "path": "Unknown",
+    "parent_class": "None",
+}
+
+# Fields the Markdown body is rendered from; the header carries everything else
+_MD_BODY_KEYS = ('metadata', 'components', 'variables', 'functions', 'interfaces', 'graphs', 'dependencies')
+
+# Rendered Markdown bodies, so structurally identical blueprints (e.g. weapon or
+# enemy variants) are only rendered once per export run. Keyed by the sizes of
+# the _MD_BODY_KEYS fields -> (fields, body fragments, characters); a hit also
+# needs the fields to compare equal. The oldest bodies are evicted once the
+# cache holds more than _MD_BODY_CACHE_MAX_CHARS characters.
+_MD_BODY_CACHE: "OrderedDict[Tuple[int, ...], Tuple[List[Any], List[str], int]]" = OrderedDict()
+_MD_BODY_CACHE_MAX_CHARS = 16 * 1024 * 1024
+_MD_BODY_CACHE_CHARS = 0
+_MD_BODY_CACHE_LOCK = threading.Lock()
+
+
+def split_data_pins(pins: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split a node's non-exec pins into (input_pins, output_pins) in one pass"""
+    input_pins, output_pins = [], []
+    for pin in pins:
+        if pin.get('type') == 'exec':
+            continue
+        direction = pin.get('direction')
+        if direction == 'input':
+            input_pins.append(pin)
+        elif direction == 'output':
+            output_pins.append(pin)
+    return input_pins, output_pins
+
+
 def generate_detailed_node_graph(nodes: List[Dict[str, Any]]) -> str:
     """Generate detailed node-by-node breakdown showing execution and data flow"""
-    md = ""
+    parts: List[str] = []
+    append_detailed_node_graph(nodes, parts)
+    return "".join(parts)
+
 
-    # Build connection map for easier lookup
+def append_detailed_node_graph(nodes: List[Dict[str, Any]], parts: List[str]) -> None:
+    """Append the detailed node-by-node breakdown for a graph to parts"""
+    # Build connection map and node lookup, and categorize nodes by type,
+    # in a single pass over the graph
     connection_map = {}
+    node_lookup = {}
+    event_nodes, function_nodes, variable_nodes, other_nodes = [], [], [], []
     for node in nodes:
-        node_id = node.get('id', '')
-        connections = node.get('connections', [])
-        connection_map[node_id] = connections
-
-    # Categorize nodes by type
-    event_nodes = [n for n in nodes if 'Event' in n.get('type', '')]
-    function_nodes = [n for n in nodes if 'CallFunction' in n.get('type', '')]
-    variable_nodes = [n for n in nodes if 'Variable' in n.get('type', '')]
-    other_nodes = [n for n in nodes if n not in event_nodes + function_nodes + variable_nodes]
+        node_id = node.get('id')
+        connection_map[node_id] = node.get('connections', [])
+        node_lookup[node_id] = node
+
+        node_type = node.get('type', '')
+        if 'Event' in node_type:
+            event_nodes.append(node)
+        elif 'CallFunction' in node_type:
+            function_nodes.append(node)
+        elif 'Variable' in node_type:
+            variable_nodes.append(node)
+        else:
+            other_nodes.append(node)
 
     # Show execution flow starting from events
     if event_nodes:
-        md += "#### Execution Flow\n\n"
+        parts.append("#### Execution Flow\n\n")
         for event_node in event_nodes:
-            md += generate_execution_chain(event_node, nodes, connection_map)
-        md += "\n"
+            generate_execution_chain(event_node, node_lookup, connection_map, parts)
+        parts.append("\n")
 
     # Show all function calls with details
     if function_nodes:
-        md += "#### Function Calls\n\n"
+        parts.append("#### Function Calls\n\n")
         for func_node in function_nodes:
-            md += generate_function_call_detail(func_node)
-        md += "\n"
+            generate_function_call_detail(func_node, parts)
+        parts.append("\n")
 
     # Show variable usage
     if variable_nodes:
-        md += "#### Variables Used\n\n"
+        parts.append("#### Variables Used\n\n")
         for var_node in variable_nodes:
             title = var_node.get('title', 'Unknown').replace('\n', ' ')
             node_type = var_node.get('type', 'Unknown')
-            md += f"- **{title}** ({node_type})\n"
-        md += "\n"
+            parts.append(f"- **{title}** ({node_type})\n")
+        parts.append("\n")
 
     # Show complete node details
-    md += "#### All Nodes (Detailed)\n\n"
+    parts.append("#### All Nodes (Detailed)\n\n")
     for idx, node in enumerate(nodes, 1):
-        md += generate_node_detail(node, idx)
-
-    return md
-
+        generate_node_detail(node, idx, parts)
 
-def generate_execution_chain(start_node: Dict[str, Any], all_nodes: List[Dict[str, Any]], connection_map: Dict) -> str:
-    """Trace execution flow from an event node"""
-    md = f"**{start_node.get('title', 'Unknown Event')}**\n\n"
 
-    # Build node lookup
-    node_lookup = {n.get('id'): n for n in all_nodes}
+def generate_execution_chain(start_node: Dict[str, Any], node_lookup: Dict[str, Dict[str, Any]], connection_map: Dict, parts: List[str]) -> None:
+    """Trace execution flow from an event node, appending markdown to parts"""
+    parts.append(f"**{start_node.get('title', 'Unknown Event')}**\n\n")
 
     # Trace execution chain
     visited = set()
     current_node = start_node
     step = 1
 
-    while current_node and current_node.get('id') not in visited:
-        node_id = current_node.get('id')
+    while current_node:
+        get = current_node.get
+        node_id = get('id')
+        if node_id in visited:
+            break
+        if step > MAX_CHAIN_DEPTH:
+            parts.append("   _(Execution chain continues...)_\n\n")
+            break
         visited.add(node_id)
 
         # Show current node
-        title = current_node.get('title', 'Unknown').replace('\n', ' → ')
-        node_type = current_node.get('type', 'Unknown')
-        md += f"{step}. **{title}** `[{node_type}]`\n"
+        title = get('title', 'Unknown').replace('\n', ' → ')
+        node_type = get('type', 'Unknown')
+        parts.append(f"{step}. **{title}** `[{node_type}]`\n")
 
         # Show input pins with values
-        pins = current_node.get('pins', [])
-        input_pins = [p for p in pins if p.get('direction') == 'input' and p.get('type') != 'exec']
+        input_pins, output_pins = split_data_pins(get('pins', ()))
         if input_pins:
-            md += "   - Inputs:\n"
+            parts.append("   - Inputs:\n")
             for pin in input_pins:
-                pin_name = pin.get('display_name', pin.get('name', 'Unknown'))
-                pin_type = pin.get('type', 'Unknown')
-                default_val = pin.get('default_value', '')
+                pin_get = pin.get
+                pin_name = pin_get('display_name', pin_get('name', 'Unknown'))
+                pin_type = pin_get('type', 'Unknown')
+                default_val = pin_get('default_value', '')
                 if default_val:
-                    md += f"     - {pin_name}: `{pin_type}` = `{default_val}`\n"
+                    parts.append(f"     - {pin_name}: `{pin_type}` = `{default_val}`\n")
                 else:
-                    md += f"     - {pin_name}: `{pin_type}`\n"
+                    parts.append(f"     - {pin_name}: `{pin_type}`\n")
 
         # Show output pins
-        output_pins = [p for p in pins if p.get('direction') == 'output' and p.get('type') != 'exec']
         if output_pins:
-            md += "   - Outputs:\n"
+            parts.append("   - Outputs:\n")
             for pin in output_pins:
-                pin_name = pin.get('display_name', pin.get('name', 'Unknown'))
-                pin_type = pin.get('type', 'Unknown')
-                md += f"     - {pin_name}: `{pin_type}`\n"
+                pin_get = pin.get
+                pin_name = pin_get('display_name', pin_get('name', 'Unknown'))
+                pin_type = pin_get('type', 'Unknown')
+                parts.append(f"     - {pin_name}: `{pin_type}`\n")
 
-        md += "\n"
+        parts.append("\n")
 
         # Find next node in execution chain (follow exec output pins)
-        connections = current_node.get('connections', [])
+        connections = get('connections', ())
         next_node = None
         if connections:
             # Try to find the next connected node
@@ -273,270 +584,649 @@ def generate_execution_chain(start_node: Dict[str, Any], all_nodes: List[Dict[st
         current_node = next_node
         step += 1
 
-        # Safety limit
-        if step > 50:
-            md += "   _(Execution chain continues...)_\n\n"
-            break
+    parts.append("\n")
 
-    md += "\n"
-    return md
 
+def generate_function_call_detail(node: Dict[str, Any], parts: List[str]) -> None:
+    """Generate detailed breakdown of a function call node, appending to parts"""
+    get = node.get
+    title = get('title', 'Unknown Function').replace('\n', ' → ')
+    category = get('category', '')
 
-def generate_function_call_detail(node: Dict[str, Any]) -> str:
-    """Generate detailed breakdown of a function call node"""
-    title = node.get('title', 'Unknown Function').replace('\n', ' → ')
-    category = node.get('category', '')
-
-    md = f"- **{title}**"
+    parts.append(f"- **{title}**")
     if category:
-        md += f" _{category}_"
-    md += "\n"
+        parts.append(f" _{category}_")
+    parts.append("\n")
 
     # Show pins
-    pins = node.get('pins', [])
-    input_pins = [p for p in pins if p.get('direction') == 'input' and p.get('type') != 'exec']
-    output_pins = [p for p in pins if p.get('direction') == 'output' and p.get('type') != 'exec']
+    input_pins, output_pins = split_data_pins(get('pins', ()))
 
     if input_pins:
-        md += "  - Parameters:\n"
+        parts.append("  - Parameters:\n")
         for pin in input_pins:
-            pin_name = pin.get('display_name', pin.get('name', 'Unknown'))
-            pin_type = pin.get('type', 'Unknown')
-            default_val = pin.get('default_value', '')
+            pin_get = pin.get
+            pin_name = pin_get('display_name', pin_get('name', 'Unknown'))
+            pin_type = pin_get('type', 'Unknown')
+            default_val = pin_get('default_value', '')
             if default_val:
-                md += f"    - `{pin_name}`: {pin_type} = `{default_val}`\n"
+                parts.append(f"    - `{pin_name}`: {pin_type} = `{default_val}`\n")
             else:
-                md += f"    - `{pin_name}`: {pin_type}\n"
+                parts.append(f"    - `{pin_name}`: {pin_type}\n")
 
     if output_pins:
-        md += "  - Returns:\n"
+        parts.append("  - Returns:\n")
         for pin in output_pins:
-            pin_name = pin.get('display_name', pin.get('name', 'Unknown'))
-            pin_type = pin.get('type', 'Unknown')
-            md += f"    - `{pin_name}`: {pin_type}\n"
+            pin_get = pin.get
+            pin_name = pin_get('display_name', pin_get('name', 'Unknown'))
+            pin_type = pin_get('type', 'Unknown')
+            parts.append(f"    - `{pin_name}`: {pin_type}\n")
 
-    md += "\n"
-    return md
+    parts.append("\n")
 
 
-def generate_node_detail(node: Dict[str, Any], index: int) -> str:
-    """Generate complete detail for a single node"""
-    node_id = node.get('id', 'Unknown')
-    title = node.get('title', 'Unknown').replace('\n', ' → ')
-    node_type = node.get('type', 'Unknown')
-    category = node.get('category', '')
-    position = node.get('position', {})
+def generate_node_detail(node: Dict[str, Any], index: int, parts: List[str]) -> None:
+    """Generate complete detail for a single node, appending to parts"""
+    get = node.get
+    node_id = get('id', 'Unknown')
+    title = get('title', 'Unknown').replace('\n', ' → ')
+    node_type = get('type', 'Unknown')
+    category = get('category', '')
+    position = get('position', {})
 
-    md = f"**Node {index}: {title}**\n"
-    md += f"- Type: `{node_type}`\n"
+    parts.append(f"**Node {index}: {title}**\n")
+    parts.append(f"- Type: `{node_type}`\n")
     if category:
-        md += f"- Category: `{category}`\n"
-    md += f"- ID: `{node_id}`\n"
-    md += f"- Position: ({position.get('x', 0)}, {position.get('y', 0)})\n"
+        parts.append(f"- Category: `{category}`\n")
+    parts.append(f"- ID: `{node_id}`\n")
+    parts.append(f"- Position: ({position.get('x', 0)}, {position.get('y', 0)})\n")
 
     # Show all pins
-    pins = node.get('pins', [])
+    pins = get('pins', ())
     if pins:
-        md += "- Pins:\n"
+        parts.append("- Pins:\n")
         for pin in pins:
-            pin_name = pin.get('display_name', pin.get('name', 'Unknown'))
-            pin_dir = pin.get('direction', 'unknown')
-            pin_type = pin.get('type', 'Unknown')
-            default_val = pin.get('default_value', '')
+            pin_get = pin.get
+            pin_name = pin_get('display_name', pin_get('name', 'Unknown'))
+            pin_dir = pin_get('direction', 'unknown')
+            pin_type = pin_get('type', 'Unknown')
+            default_val = pin_get('default_value', '')
 
-            pin_str = f"  - [{pin_dir}] `{pin_name}`: {pin_type}"
             if default_val:
-                pin_str += f" = `{default_val}`"
-            md += pin_str + "\n"
+                parts.append(f"  - [{pin_dir}] `{pin_name}`: {pin_type} = `{default_val}`\n")
+            else:
+                parts.append(f"  - [{pin_dir}] `{pin_name}`: {pin_type}\n")
 
     # Show connections
-    connections = node.get('connections', [])
+    connections = get('connections', ())
     if connections:
-        md += f"- Connected to: {', '.join([f'`{c}`' for c in connections])}\n"
+        parts.append(f"- Connected to: {', '.join([f'`{c}`' for c in connections])}\n")
 
-    md += "\n"
-    return md
+    parts.append("\n")
 
 
-def generate_markdown(data: Dict[str, Any]) -> str:
-    """Generate human-readable Markdown from blueprint data"""
+def write_markdown(data: Dict[str, Any], f: TextIO):
+    """Write human-readable Markdown for blueprint data directly to an open text stream"""
+    write = f.write
 
-    exported_time = data.get('exported_at', datetime.now().isoformat())
+    exported_time = data.get('exported_at')
+    if exported_time is None:
+        exported_time = get_export_timestamp()
 
-    md = f"""# {data['name']}
+    write(_MD_HEADER.format_map(ChainMap({'exported_at': exported_time}, data, _MD_HEADER_DEFAULTS)))
+    f.writelines(get_markdown_body(data))
 
-**Type:** {data.get('class_type', 'Blueprint')}
-**Path:** `{data.get('path', 'Unknown')}`
-**Parent Class:** {data.get('parent_class', 'None')}
-**Exported:** {exported_time}
 
-"""
+def get_markdown_body(data: Dict[str, Any]) -> List[str]:
+    """
+    Get the Markdown body (everything below the header) as a list of fragments,
+    reusing an earlier render of identical data. Don't modify the returned list.
+    """
+    global _MD_BODY_CACHE_CHARS
+    fields = [data.get(k) for k in _MD_BODY_KEYS]
+    key = tuple(len(field) if field else 0 for field in fields)
+
+    with _MD_BODY_CACHE_LOCK:
+        cached = _MD_BODY_CACHE.get(key)
+    if cached is not None and cached[0] == fields:
+        return cached[1]
+
+    parts: List[str] = []
+    append_markdown_body(data, parts)
+    size = sum(map(len, parts))
+    if size <= _MD_BODY_CACHE_MAX_CHARS:
+        with _MD_BODY_CACHE_LOCK:
+            replaced = _MD_BODY_CACHE.pop(key, None)
+            if replaced is not None:
+                _MD_BODY_CACHE_CHARS -= replaced[2]
+            _MD_BODY_CACHE[key] = (fields, parts, size)
+            _MD_BODY_CACHE_CHARS += size
+            while _MD_BODY_CACHE_CHARS > _MD_BODY_CACHE_MAX_CHARS:
+                _MD_BODY_CACHE_CHARS -= _MD_BODY_CACHE.popitem(last=False)[1][2]
+    return parts
+
+
+def clear_markdown_body_cache():
+    """Drop all cached Markdown bodies"""
+    global _MD_BODY_CACHE_CHARS
+    with _MD_BODY_CACHE_LOCK:
+        _MD_BODY_CACHE.clear()
+        _MD_BODY_CACHE_CHARS = 0
+
+
+def append_markdown_body(data: Dict[str, Any], parts: List[str]):
+    """Append the Markdown sections that follow the header to parts"""
+    append = parts.append
 
     # Description
     if data.get('metadata', {}).get('description'):
-        md += f"## Description\n\n{data['metadata']['description']}\n\n"
+        append(f"## Description\n\n{data['metadata']['description']}\n\n")
 
     # Components
     if data['components']:
-        md += "## Components\n\n"
+        append("## Components\n\n")
         for comp in data['components']:
-            md += f"- **{comp['name']}** ({comp['class']})\n"
-        md += "\n"
+            append(f"- **{comp['name']}** ({comp['class']})\n")
+        append("\n")
 
     # Variables
     if data['variables']:
-        md += "## Variables\n\n"
-        md += "| Name | Type | Category | Exposed |\n"
-        md += "|------|------|----------|----------|\n"
-        for var in data['variables']:
-            md += f"| {var.get('name', 'N/A')} | {var.get('type', 'N/A')} | {var.get('category', 'N/A')} | {var.get('is_exposed', 'N/A')} |\n"
-        md += "\n"
+        append("## Variables\n\n")
+        append("| Name | Type | Category | Exposed |\n")
+        append("|------|------|----------|----------|\n")
+        get = dict.get
+        append("".join(
+            f"| {get(v, 'name', 'N/A')} | {get(v, 'type', 'N/A')} | {get(v, 'category', 'N/A')} | {get(v, 'is_exposed', 'N/A')} |\n"
+            for v in data['variables']
+        ))
+        append("\n")
 
     # Functions
     if data['functions']:
-        md += "## Functions\n\n"
+        append("## Functions\n\n")
+        get = dict.get
         for func in data['functions']:
-            params = ", ".join([f"{p['name']}: {p['type']}" for p in func.get('parameters', [])])
-            md += f"### {func['name']}({params})\n\n"
-            if func.get('description'):
-                md += f"{func['description']}\n\n"
-        md += "\n"
+            params = ", ".join(f"{p['name']}: {p['type']}" for p in get(func, 'parameters', ()))
+            append(f"### {func['name']}({params})\n\n")
+            description = get(func, 'description')
+            if description:
+                append(f"{description}\n\n")
+        append("\n")
 
     # Interfaces
     if data.get('interfaces'):
-        md += "## Implemented Interfaces\n\n"
+        append("## Implemented Interfaces\n\n")
         for interface in data['interfaces']:
-            md += f"- {interface}\n"
-        md += "\n"
+            append(f"- {interface}\n")
+        append("\n")
 
     # Graphs (from C++ plugin) - DETAILED NODE-BY-NODE LOGIC
     if data.get('graphs'):
-        md += "## Graphs & Node Logic\n\n"
+        append("## Graphs & Node Logic\n\n")
         for graph in data['graphs']:
             graph_name = graph.get('name', 'Unknown')
             nodes = graph.get('nodes', [])
-            md += f"### {graph_name}\n\n"
-            md += f"**Total Nodes:** {len(nodes)}\n\n"
+            append(f"### {graph_name}\n\n")
+            append(f"**Total Nodes:** {len(nodes)}\n\n")
 
             if nodes:
-                md += generate_detailed_node_graph(nodes)
-        md += "\n"
+                append_detailed_node_graph(nodes, parts)
+        append("\n")
 
     # Dependencies
     if data.get('dependencies'):
-        md += "## Dependencies\n\n"
+        append("## Dependencies\n\n")
         for dep in data['dependencies'][:10]:  # Limit to first 10
-            md += f"- `{dep}`\n"
-        md += "\n"
+            append(f"- `{dep}`\n")
+        append("\n")
+
+
+def generate_markdown(data: Dict[str, Any]) -> str:
+    """Generate human-readable Markdown from blueprint data"""
+    buffer = io.StringIO()
+    write_markdown(data, buffer)
+    return buffer.getvalue()
+
+
+# ============================================================================
+# EXPORT MANIFEST (incremental export)
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def get_content_dir() -> str:
+    """Get the absolute path of the project's Content directory"""
+    return unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_content_dir())
+
+
+def get_package_file(package_name: str) -> Optional[str]:
+    """
+    Convert a /Game package name to its .uasset file on disk
+    /Game/Characters/BP_Player -> <Project>/Content/Characters/BP_Player.uasset
+    """
+    if not package_name.startswith("/Game/"):
+        return None
+    return os.path.join(get_content_dir(), package_name[len("/Game/"):] + ".uasset")
+
+
+def get_source_stamp(package_name: str) -> Optional[Tuple[int, int]]:
+    """Get (mtime_ns, size) of a package's .uasset, or None if it can't be found"""
+    package_file = get_package_file(package_name)
+    if package_file is None:
+        return None
+    try:
+        stat = os.stat(package_file)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_manifest() -> Dict[str, Dict[str, Any]]:
+    """Load the export manifest (package name -> source stamp and output files)"""
+    manifest_path = os.path.join(ensure_output_dir(), MANIFEST_FILE)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: Dict[str, Dict[str, Any]]):
+    """Write the export manifest"""
+    manifest_path = os.path.join(ensure_output_dir(), MANIFEST_FILE)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, separators=(",", ":"))
 
-    return md
+
+def get_export_mode(use_registry: bool) -> Dict[str, Any]:
+    """
+    Describe how the current run produces its output
+    Entries recorded in a different mode (e.g. before the C++ plugin was
+    compiled) are treated as stale.
+    """
+    return {
+        # Bump when the files written for the same settings change
+        "version": 2,
+        "graphs": bool(INCLUDE_GRAPH_NODES and _BP_EXPORT_FN is not None),
+        "pretty": PRETTY_JSON,
+        "registry": use_registry,
+    }
+
+
+def make_manifest_entry(stamp: Tuple[int, int], json_path: str, md_path: Optional[str], mode: Dict[str, Any], extra_formats: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Build a manifest entry; output paths are stored relative to the output root"""
+    output_root = ensure_output_dir()
+    return {
+        "uasset_mtime": stamp[0],
+        "uasset_size": stamp[1],
+        "mode": mode,
+        "json": os.path.relpath(json_path, output_root),
+        "md": os.path.relpath(md_path, output_root) if md_path else None,
+        "extra": list(extra_formats)
+    }
+
+
+def is_export_current(entry: Optional[Dict[str, Any]], stamp: Optional[Tuple[int, int]], existing: Set[str], mode: Dict[str, Any], extra_formats: Tuple[str, ...] = ()) -> bool:
+    """
+    Check whether a manifest entry still matches the source, was exported in
+    the current mode (see get_export_mode()) and its outputs exist
+    existing: absolute paths of the .json/.md files currently in the output tree
+    """
+    if not entry or stamp is None:
+        return False
+    if entry.get("uasset_mtime") != stamp[0] or entry.get("uasset_size") != stamp[1]:
+        return False
+    if entry.get("mode") != mode:
+        return False
+    if not set(extra_formats).issubset(entry.get("extra", ())):
+        return False
+
+    output_root = ensure_output_dir()
+    if os.path.join(output_root, entry.get("json", "")) not in existing:
+        return False
+    if GENERATE_MARKDOWN:
+        md = entry.get("md")
+        return bool(md) and os.path.join(output_root, md) in existing
+    return True
+
+
+def adopt_existing_export(asset_data, stamp: Tuple[int, int], existing: Set[str], mode: Dict[str, Any], extra_formats: Tuple[str, ...] = ()) -> Optional[Dict[str, Any]]:
+    """
+    Build a manifest entry for a blueprint with no entry yet (e.g. the manifest
+    was deleted) whose outputs on disk are newer than its .uasset, so it can be
+    skipped without loading the asset. Returns None if it must be re-exported.
+    Only exports whose mode can be verified from the files are adopted: a
+    graph export with Markdown rendered here from that exact JSON.
+    """
+    if extra_formats or not GENERATE_MARKDOWN or not mode["graphs"]:
+        # Extra format files aren't part of the output walk, and without
+        # Markdown or graphs the JSON doesn't show how it was made
+        return None
+
+    json_path, md_path, _ = get_export_paths(f"{asset_data.package_name}.{asset_data.asset_name}")
+    if json_path not in existing or md_path not in existing:
+        return None
+    try:
+        if os.stat(json_path).st_mtime_ns < stamp[0]:
+            return None
+        with open(json_path, 'rb') as f:
+            json_bytes = f.read()
+    except OSError:
+        return None
+
+    if read_hash_sidecar(md_path) != get_markdown_digest(json_bytes):
+        return None
+    if json_bytes.startswith(b"{\n") != mode["pretty"]:
+        return None
+    try:
+        if "graphs" not in loads_json(json_bytes):
+            return None
+    except ValueError:
+        return None
+    return make_manifest_entry(stamp, json_path, md_path, mode)
 
 
 # ============================================================================
 # EXPORT FUNCTIONS
 # ============================================================================
 
-def export_blueprint(blueprint: unreal.Blueprint) -> bool:
-    """Export a single blueprint to JSON and Markdown"""
+def get_export_paths(blueprint_path: str, extra_formats: Tuple[str, ...] = ()) -> Tuple[str, Optional[str], Dict[str, str]]:
+    """
+    Get (json_path, md_path, extra_paths) for a blueprint
+    md_path is None when markdown is disabled. extra_paths maps each of
+    extra_formats to its output file.
+    """
+    extensions = [".json"]
+    if GENERATE_MARKDOWN:
+        extensions.append(".md")
+    extensions.extend(_EXTRA_FORMAT_WRITERS[fmt][0] for fmt in extra_formats)
+    output_paths = get_output_paths(blueprint_path, tuple(extensions))
+
+    extra_paths = {fmt: output_paths[_EXTRA_FORMAT_WRITERS[fmt][0]] for fmt in extra_formats}
+    return output_paths[".json"], output_paths.get(".md"), extra_paths
+
+
+def extract_blueprint_export(blueprint: unreal.Blueprint, extra_formats: Tuple[str, ...] = ()) -> Tuple[Any, str, Optional[str], Dict[str, str]]:
+    """
+    Gather everything needed to export a blueprint (calls UE API - main thread only)
+    Returns (payload, json_path, md_path, extra_paths), see get_export_paths().
+    The payload is the plugin's raw JSON string for JSON-only exports,
+    otherwise the blueprint data dict.
+    """
+    json_path, md_path, extra_paths = get_export_paths(blueprint.get_path_name(), extra_formats)
+
+    # JSON-only export: write the plugin's string straight to disk
+    # instead of re-serializing it from a Python dict
+    if not GENERATE_MARKDOWN and not extra_formats:
+        json_string = extract_blueprint_json(blueprint)
+        if json_string is None:
+            return extract_blueprint_metadata(blueprint), json_path, None, extra_paths
+        try:
+            data = loads_json(json_string)
+        except ValueError as e:
+            unreal.log_error(f"Error parsing blueprint data: {e}")
+            return extract_blueprint_metadata(blueprint), json_path, None, extra_paths
+
+        # The plugin writes condensed JSON; re-serialize it when it has to be
+        # indented, or when it came from a plugin build that still indents it
+        if not PRETTY_JSON and "\n" not in json_string:
+            return json_string, json_path, None, extra_paths
+        return data, json_path, None, extra_paths
+
+    # Extract data
+    data = extract_blueprint_data_full(blueprint)
+    return data, json_path, md_path, extra_paths
+
+
+# Renderer tag recorded with the JSON hash in .md.sha256 sidecars, so Markdown
+# written by generate_markdown_from_json.py or an older version of this
+# renderer is regenerated. Bump it whenever the Markdown output changes.
+_MD_RENDERER_TAG = "watcher-md-v1"
+
+
+def get_markdown_digest(json_bytes: bytes) -> str:
+    """Get the sidecar value for Markdown rendered here from the given JSON"""
+    return f"{_MD_RENDERER_TAG}:{hashlib.sha256(json_bytes).hexdigest()}"
+
+
+def read_hash_sidecar(md_path: str) -> Optional[str]:
+    """Read the renderer tag and JSON hash recorded next to a markdown file (None if missing)"""
     try:
-        blueprint_path = blueprint.get_path_name()
+        with open(md_path + ".sha256", 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def write_hash_sidecar(md_path: str, digest: str):
+    """Record the renderer tag and hash of the JSON a markdown file was generated from"""
+    with open(md_path + ".sha256", 'w', encoding='utf-8') as f:
+        f.write(digest)
+
+
+def write_blueprint_export(payload: Any, json_path: str, md_path: Optional[str], extra_paths: Optional[Dict[str, str]] = None, force: bool = False) -> Tuple[str, Optional[str]]:
+    """
+    Write the JSON, Markdown and any extra format files for an extracted blueprint
+    Pure Python (no UE API calls), so it is safe to run on a worker thread
+    force: rewrite the Markdown even if the sidecar says it is up to date
+    """
+    # Save JSON (through a temp file, so a failed write never truncates the previous export)
+    if isinstance(payload, str):
+        json_bytes = payload.encode('utf-8')
+    else:
+        json_bytes = dumps_json(payload)
+    write_bytes_atomic(json_path, json_bytes)
+
+    # Generate and save Markdown, unless this renderer already generated it from identical JSON
+    if md_path:
+        digest = get_markdown_digest(json_bytes)
+        if force or read_hash_sidecar(md_path) != digest or not os.path.exists(md_path):
+            tmp_path = md_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8', newline='\n', buffering=_WRITE_BUFFER_SIZE) as f:
+                write_markdown(payload, f)
+            os.replace(tmp_path, md_path)
+            write_hash_sidecar(md_path, digest)
 
-        # Extract data
-        data = extract_blueprint_data_full(blueprint)
+    # Save extra formats
+    if extra_paths:
+        for fmt, path in extra_paths.items():
+            _EXTRA_FORMAT_WRITERS[fmt][1](payload, path)
 
-        # Save JSON
-        json_path = get_output_path(blueprint_path, ".json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    return json_path, md_path
 
-        unreal.log(f"Exported JSON: {json_path}")
 
-        # Generate and save Markdown
-        if GENERATE_MARKDOWN:
-            md_content = generate_markdown(data)
-            md_path = get_output_path(blueprint_path, ".md")
-            with open(md_path, 'w', encoding='utf-8') as f:
-                f.write(md_content)
+def log_blueprint_export(json_path: str, md_path: Optional[str]):
+    """Log the files written for a blueprint"""
+    unreal.log(f"Exported JSON: {json_path}")
+    if md_path:
+        unreal.log(f"Exported Markdown: {md_path}")
 
-            unreal.log(f"Exported Markdown: {md_path}")
 
-        return True
+def export_blueprint(blueprint: unreal.Blueprint) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Export a single blueprint to JSON and Markdown
+    Returns (json_path, md_path) on success, md_path is None when markdown is disabled
+    Returns None on failure
+    """
+    reset_output_dirs()
+    try:
+        export = extract_blueprint_export(blueprint, tuple(get_extra_formats()))
+        json_path, md_path = write_blueprint_export(*export)
+        log_blueprint_export(json_path, md_path)
+        return json_path, md_path
 
     except Exception as e:
         unreal.log_error(f"Failed to export blueprint {blueprint.get_name()}: {str(e)}")
-        return False
+        return None
+
+    finally:
+        clear_markdown_body_cache()
 
 
-def export_all_blueprints() -> int:
-    """Export all blueprints in the project"""
+def export_all_blueprints(force: bool = False) -> int:
+    """
+    Export all blueprints in the project
+    Unchanged blueprints are skipped when INCREMENTAL_EXPORT is on, unless force is set
+    Returns the number of blueprints written
+    """
+    global _EXPORT_TIMESTAMP
     unreal.log("Starting blueprint export...")
+    reset_output_dirs()
+
+    # One timestamp for the whole run
+    _EXPORT_TIMESTAMP = datetime.now().isoformat()
+    try:
+        return export_blueprint_assets(force)
+    finally:
+        _EXPORT_TIMESTAMP = None
+        clear_markdown_body_cache()
 
+
+def export_blueprint_assets(force: bool = False) -> int:
+    """Export the project's blueprints for the current run, see export_all_blueprints()"""
     # Get asset registry
     asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
 
-    # Get all blueprint assets
+    # Get all blueprint assets saved under /Game (skips Engine/plugin content)
     filter = unreal.ARFilter(
         class_names=["Blueprint"],
-        recursive_paths=True
+        package_paths=["/Game"],
+        recursive_paths=True,
+        include_only_on_disk_assets=True
     )
 
     assets = asset_registry.get_assets(filter)
 
+    output_root = ensure_output_dir()
+    extra_formats = tuple(get_extra_formats())
+    manifest = load_manifest() if INCREMENTAL_EXPORT and not force else {}
+
+    # Metadata can come straight from registry tags when graphs aren't exported
+    use_registry = METADATA_FROM_REGISTRY and (not INCLUDE_GRAPH_NODES or _BP_EXPORT_FN is None)
+    mode = get_export_mode(use_registry)
+
+    # Existing outputs, gathered in one walk instead of a stat per blueprint
+    existing: Set[str] = set()
+    if INCREMENTAL_EXPORT and not force:
+        json_paths, md_paths = collect_outputs(output_root)
+        existing.update(json_paths)
+        existing.update(md_paths)
+    new_manifest: Dict[str, Dict[str, Any]] = {}
+    exported_md_paths: List[str] = []
+    skipped_count = 0
+
+    # Extract on the main thread (UE reflection is not thread-safe) and
+    # overlap the file writes and markdown generation on worker threads
+    pending = []
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+        for asset_data in assets:
+            # Skip unchanged blueprints before loading them
+            package_name = str(asset_data.package_name)
+            stamp = get_source_stamp(package_name) if INCREMENTAL_EXPORT else None
+            entry = manifest.get(package_name)
+            if entry is None and stamp is not None and existing:
+                entry = adopt_existing_export(asset_data, stamp, existing, mode, extra_formats)
+            if is_export_current(entry, stamp, existing, mode, extra_formats):
+                new_manifest[package_name] = entry
+                if entry.get("md"):
+                    exported_md_paths.append(os.path.join(output_root, entry["md"]))
+                skipped_count += 1
+                continue
+
+            data = extract_from_asset_data(asset_data) if use_registry else None
+            if data is not None:
+                name = data["name"]
+                export = (data, *get_export_paths(data["path"], extra_formats))
+            else:
+                # ARFilter already restricts results to the Blueprint class
+                asset = asset_data.get_asset()
+                if asset is None:
+                    continue
+
+                name = asset.get_name()
+                try:
+                    export = extract_blueprint_export(asset, extra_formats)
+                except Exception as e:
+                    unreal.log_error(f"Failed to export blueprint {name}: {str(e)}")
+                    continue
+            pending.append((name, package_name, stamp, executor.submit(write_blueprint_export, *export, force=force)))
+
+            # Don't let extraction run too far ahead of the writers
+            if len(pending) >= MAX_PENDING_EXPORTS:
+                wait([pending[-MAX_PENDING_EXPORTS][3]])
+
     exported_count = 0
-    for asset_data in assets:
-        asset = asset_data.get_asset()
-        if isinstance(asset, unreal.Blueprint):
-            if export_blueprint(asset):
-                exported_count += 1
+    for name, package_name, stamp, future in pending:
+        try:
+            json_path, md_path = future.result()
+        except Exception as e:
+            unreal.log_error(f"Failed to export blueprint {name}: {str(e)}")
+            continue
 
-    # Generate index
-    generate_index()
+        log_blueprint_export(json_path, md_path)
+        exported_count += 1
+        if md_path:
+            exported_md_paths.append(md_path)
+        if stamp is not None:
+            new_manifest[package_name] = make_manifest_entry(stamp, json_path, md_path, mode, extra_formats)
 
+    if INCREMENTAL_EXPORT:
+        save_manifest(new_manifest)
+
+    # Generate index from the files we just wrote plus the unchanged ones
+    # (without markdown this run, fall back to whatever is on disk)
+    generate_index(exported_md_paths if GENERATE_MARKDOWN else None)
+
+    if skipped_count:
+        unreal.log(f"Skipped {skipped_count} unchanged blueprints")
     unreal.log(f"Export complete! Exported {exported_count} blueprints to {OUTPUT_DIR}")
     return exported_count
 
 
-def generate_index():
-    """Generate an index file listing all exported blueprints"""
+def generate_index(md_paths: Optional[List[str]] = None):
+    """
+    Generate an index file listing all exported blueprints
+    md_paths: markdown files produced by this export run. When None
+    (e.g. called standalone), the output tree is walked instead.
+    """
     output_root = ensure_output_dir()
     index_path = os.path.join(output_root, "index.md")
 
-    # Collect all exported markdown files
-    blueprint_files = []
-    for root, dirs, files in os.walk(output_root):
-        for file in files:
-            if file.endswith('.md') and file != 'index.md':
-                rel_path = os.path.relpath(os.path.join(root, file), output_root)
-                blueprint_files.append(rel_path)
+    # Collect all exported markdown files, relative to the output root
+    # (output_root is normalised without a trailing separator and every path is
+    # output_root + os.sep + ..., so slicing off the prefix is enough)
+    if md_paths is None:
+        md_paths = collect_outputs(output_root)[1]
+    prefix_len = len(output_root) + 1
+    blueprint_files = [md_path[prefix_len:] for md_path in md_paths]
 
     blueprint_files.sort()
 
     # Generate index content
-    content = f"""# Blueprint Index
+    content = [f"""# Blueprint Index
 
 **Total Blueprints:** {len(blueprint_files)}
-**Last Updated:** {datetime.now().isoformat()}
+**Last Updated:** {get_export_timestamp()}
 
 ## All Blueprints
 
-"""
+"""]
+    append = content.append
 
+    sep = os.sep
     current_category = None
     for bp_file in blueprint_files:
         # Extract category from path
-        parts = bp_file.split(os.sep)
+        parts = bp_file.split(sep)
         if len(parts) > 1:
             category = parts[0]
             if category != current_category:
                 current_category = category
-                content += f"\n### {category}\n\n"
+                append(f"\n### {category}\n\n")
 
-        bp_name = parts[-1].replace('.md', '')
-        content += f"- [{bp_name}]({bp_file})\n"
+        append(f"- [{parts[-1][:-3]}]({bp_file})\n")
 
     # Write index
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    with open(index_path, 'wb') as f:
+        f.write("".join(content).encode('utf-8'))
 
     unreal.log(f"Generated index: {index_path}")
 
@@ -3,22 +3,68 @@ Generate Markdown files from existing JSON exports
 Run this to create markdown files from the C++ plugin JSON exports
 """
 
+import hashlib
 import json
 import os
-from pathlib import Path
+import sys
 from datetime import datetime
 
+# Optional faster JSON parser (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 PROJECT_ROOT = "/Users/fromastermarv/Documents/Unreal Projects/exporter_fps_mvp"
 JSON_DIR = os.path.join(PROJECT_ROOT, "ClaudeCodeDocs/Blueprints")
 
+# Use worker processes when there are at least this many JSON files
+PARALLEL_THRESHOLD = 64
+
+
+def collect_outputs(root):
+    """
+    Collect exported .json and .md files under root in a single walk
+    Returns (json_mtimes, md_mtimes), each mapping path -> st_mtime_ns.
+    Index files and dotfiles (e.g. the exporter's manifest) are skipped. Uses
+    os.scandir so the stat comes from the directory entry where the OS provides it.
+    """
+    json_mtimes, md_mtimes = {}, {}
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Missing or unreadable directory: skip it, as os.walk does
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif name.startswith('.'):
+                    continue
+                elif name.endswith('.json'):
+                    if name != 'index.json':
+                        json_mtimes[entry.path] = entry.stat().st_mtime_ns
+                elif name.endswith('.md'):
+                    if name != 'index.md':
+                        md_mtimes[entry.path] = entry.stat().st_mtime_ns
+    return json_mtimes, md_mtimes
+
 
-def generate_markdown(data):
-    """Generate human-readable Markdown from blueprint data"""
+def generate_markdown(data, default_ts=None):
+    """
+    Generate human-readable Markdown from blueprint data
+    default_ts: timestamp shown when the data has no exported_at (defaults to now)
+    """
 
-    exported_time = data.get('exported_at', datetime.now().isoformat())
+    exported_time = data.get('exported_at')
+    if exported_time is None:
+        exported_time = default_ts or datetime.now().isoformat()
 
-    md = f"""# {data.get('name', 'Unknown')}
+    out = [f"""# {data.get('name', 'Unknown')}
 
 **Type:** {data.get('class_type', 'Blueprint')}
 **Path:** `{data.get('path', 'Unknown')}`
@@ -26,114 +72,211 @@ def generate_markdown(data):
 **Generated Class:** {data.get('generated_class', 'None')}
 **Exported:** {exported_time}
 
-"""
+"""]
+    append = out.append
 
     # Components
     components = data.get('components', [])
     if components:
-        md += "## Components\n\n"
+        append("## Components\n\n")
         for comp in components:
-            md += f"- **{comp.get('name', 'Unknown')}** ({comp.get('class', 'Unknown')})\n"
-        md += "\n"
+            append(f"- **{comp.get('name', 'Unknown')}** ({comp.get('class', 'Unknown')})\n")
+        append("\n")
 
     # Variables
     variables = data.get('variables', [])
     if variables:
-        md += "## Variables\n\n"
-        md += "| Name | Type | Category | Default |\n"
-        md += "|------|------|----------|----------|\n"
-        for var in variables:
-            name = var.get('name', 'N/A')
-            var_type = var.get('type', 'N/A')
-            category = var.get('category', 'N/A')
-            default = var.get('default_value', '')
-            md += f"| {name} | {var_type} | {category} | {default} |\n"
-        md += "\n"
+        append("## Variables\n\n")
+        append("| Name | Type | Category | Default |\n")
+        append("|------|------|----------|----------|\n")
+        get = dict.get
+        append("".join(
+            f"| {get(v, 'name', 'N/A')} | {get(v, 'type', 'N/A')} | {get(v, 'category', 'N/A')} | {get(v, 'default_value', '')} |\n"
+            for v in variables
+        ))
+        append("\n")
 
     # Functions
     functions = data.get('functions', [])
     if functions:
-        md += "## Functions\n\n"
+        append("## Functions\n\n")
+        get = dict.get
         for func in functions:
-            params = func.get('parameters', [])
-            param_str = ", ".join([f"{p.get('name', '')}: {p.get('type', '')}" for p in params])
-            md += f"### {func.get('name', 'Unknown')}({param_str})\n\n"
-        md += "\n"
+            param_str = ", ".join(f"{get(p, 'name', '')}: {get(p, 'type', '')}" for p in get(func, 'parameters', ()))
+            append(f"### {get(func, 'name', 'Unknown')}({param_str})\n\n")
+        append("\n")
 
     # Graphs (from C++ plugin)
     graphs = data.get('graphs', [])
     if graphs:
-        md += "## Graphs\n\n"
+        append("## Graphs\n\n")
         for graph in graphs:
             graph_name = graph.get('name', 'Unknown')
             nodes = graph.get('nodes', [])
-            md += f"### {graph_name}\n\n"
-            md += f"**Total Nodes:** {len(nodes)}\n\n"
+            append(f"### {graph_name}\n\n")
+            append(f"**Total Nodes:** {len(nodes)}\n\n")
+
+            # Collect the first 10 events, and function calls while there are
+            # few enough to list (more than 20 and the section is omitted)
+            event_nodes, call_nodes = [], []
+            for node in nodes:
+                node_type = node.get('type', '')
+                if 'Event' in node_type and len(event_nodes) < 10:
+                    event_nodes.append(node)
+                if 'CallFunction' in node_type and len(call_nodes) <= 20:
+                    call_nodes.append(node)
+                if len(event_nodes) >= 10 and len(call_nodes) > 20:
+                    break
 
             # Show key nodes (events)
-            event_nodes = [n for n in nodes if 'Event' in n.get('type', '')]
             if event_nodes:
-                md += "**Event Nodes:**\n"
-                for node in event_nodes[:10]:
+                append("**Event Nodes:**\n")
+                for node in event_nodes:
                     title = node.get('title', 'Unknown').replace('\n', ' - ')
-                    md += f"- {title}\n"
-                md += "\n"
+                    append(f"- {title}\n")
+                append("\n")
 
             # Show function calls
-            call_nodes = [n for n in nodes if 'CallFunction' in n.get('type', '')]
             if call_nodes and len(call_nodes) <= 20:
-                md += "**Function Calls:**\n"
-                for node in call_nodes[:20]:
+                append("**Function Calls:**\n")
+                for node in call_nodes:
                     title = node.get('title', 'Unknown').replace('\n', ' - ')
-                    md += f"- {title}\n"
-                md += "\n"
-        md += "\n"
+                    append(f"- {title}\n")
+                append("\n")
+        append("\n")
 
     # Dependencies
     dependencies = data.get('dependencies', [])
     if dependencies:
-        md += "## Dependencies\n\n"
+        append("## Dependencies\n\n")
         for dep in dependencies[:15]:
-            md += f"- `{dep}`\n"
+            append(f"- `{dep}`\n")
         if len(dependencies) > 15:
-            md += f"\n_...and {len(dependencies) - 15} more_\n"
-        md += "\n"
+            append(f"\n_...and {len(dependencies) - 15} more_\n")
+        append("\n")
+
+    return "".join(out)
+
+
+# Renderer tag recorded with the JSON hash in .md.sha256 sidecars, so Markdown
+# written by blueprint_watcher.py or an older version of this script is
+# regenerated. Bump it whenever the Markdown output changes.
+MD_RENDERER_TAG = "standalone-md-v1"
+
+
+def get_markdown_digest(raw):
+    """Get the sidecar value for Markdown rendered here from the given JSON bytes"""
+    return f"{MD_RENDERER_TAG}:{hashlib.sha256(raw).hexdigest()}"
+
+
+def read_hash_sidecar(md_path):
+    """Read the renderer tag and JSON hash recorded next to a markdown file (None if missing)"""
+    try:
+        with open(md_path + ".sha256", 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def write_hash_sidecar(md_path, digest):
+    """Record the renderer tag and hash of the JSON a markdown file was generated from"""
+    with open(md_path + ".sha256", 'w', encoding='utf-8') as f:
+        f.write(digest)
 
-    return md
+
+def process_json_file(json_path, md_exists=True, run_ts=None):
+    """
+    Create the markdown file for a single JSON export
+    Returns (status, error) where status is 'created', 'skipped' or 'failed'
+    Runs in worker processes, so it has to stay a module-level function
+    """
+    try:
+        # Read JSON
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+
+        # Skip if this script already generated the markdown from identical JSON
+        md_path = json_path.replace('.json', '.md')
+        digest = get_markdown_digest(raw)
+        if md_exists and read_hash_sidecar(md_path) == digest:
+            return "skipped", None
+
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+        # Generate markdown
+        md_content = generate_markdown(data, run_ts)
+
+        # Write markdown
+        with open(md_path, 'wb') as f:
+            f.write(md_content.encode('utf-8'))
+        write_hash_sidecar(md_path, digest)
+
+        return "created", None
+
+    except Exception as e:
+        return "failed", str(e)
+
+
+def can_use_worker_processes():
+    """
+    Check whether worker processes would run Python. They are started with
+    sys.executable, which is the editor binary (not a Python interpreter)
+    when this script is run inside Unreal with `py`.
+    """
+    return os.path.basename(sys.executable).lower().startswith("python")
 
 
 def process_json_files():
     """Process all JSON files and create markdown"""
 
-    json_files = []
-    for root, dirs, files in os.walk(JSON_DIR):
-        for file in files:
-            if file.endswith('.json') and file != 'index.json':
-                json_files.append(os.path.join(root, file))
+    if not os.path.isdir(JSON_DIR):
+        print(f"JSON directory not found: {JSON_DIR}")
+        print("Set PROJECT_ROOT at the top of this script to your Unreal project folder")
+        return
 
-    print(f"Found {len(json_files)} JSON files")
+    run_ts = datetime.now().isoformat()
+    json_mtimes, md_mtimes = collect_outputs(JSON_DIR)
 
-    success_count = 0
-    for json_path in json_files:
-        try:
-            # Read JSON
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    print(f"Found {len(json_mtimes)} JSON files")
 
-            # Generate markdown
-            md_content = generate_markdown(data)
+    # Skip JSON files whose markdown is newer (and was generated by this
+    # script, not the exporter) without reading them
+    tag_prefix = MD_RENDERER_TAG + ":"
+    json_files = []
+    md_exists = []
+    skipped_count = 0
+    for json_path, json_mtime in json_mtimes.items():
+        md_path = json_path.replace('.json', '.md')
+        md_mtime = md_mtimes.get(md_path)
+        if md_mtime is not None and md_mtime >= json_mtime and (read_hash_sidecar(md_path) or "").startswith(tag_prefix):
+            skipped_count += 1
+            continue
+        json_files.append(json_path)
+        md_exists.append(md_mtime is not None)
 
-            # Write markdown
-            md_path = json_path.replace('.json', '.md')
-            with open(md_path, 'w', encoding='utf-8') as f:
-                f.write(md_content)
+    # Files are independent, so spread them over worker processes when
+    # there are enough to outweigh the process startup cost
+    run_ts_args = [run_ts] * len(json_files)
+    if len(json_files) >= PARALLEL_THRESHOLD and can_use_worker_processes():
+        # Imported here so small runs don't pay for loading multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(process_json_file, json_files, md_exists, run_ts_args, chunksize=32))
+    else:
+        results = list(map(process_json_file, json_files, md_exists, run_ts_args))
 
-            print(f"✓ Created: {os.path.basename(md_path)}")
+    success_count = 0
+    for json_path, (status, error) in zip(json_files, results):
+        if status == "created":
+            print(f"✓ Created: {os.path.basename(json_path.replace('.json', '.md'))}")
             success_count += 1
+        elif status == "skipped":
+            skipped_count += 1
+        else:
+            print(f"✗ Failed: {os.path.basename(json_path)} - {error}")
 
-        except Exception as e:
-            print(f"✗ Failed: {os.path.basename(json_path)} - {e}")
-
+    if skipped_count:
+        print(f"\nSkipped {skipped_count} unchanged files")
     print(f"\n✅ Successfully created {success_count} markdown files!")
 
 
@@ -12,6 +12,7 @@
 #include "Dom/JsonObject.h"
 #include "Serialization/JsonSerializer.h"
 #include "Serialization/JsonWriter.h"
+#include "Policies/CondensedJsonPrintPolicy.h"
 #include "Misc/FileHelper.h"
 #include "HAL/PlatformFileManager.h"
 #include "Engine/SimpleConstructionScript.h"
@@ -31,9 +32,9 @@ FString UBlueprintExporterLibrary::ExtractBlueprintData(UBlueprint* Blueprint)
 
 	TSharedPtr<FJsonObject> JsonObject = SerializeBlueprint(Blueprint);
 
-	// Convert to string
+	// Convert to string (condensed, so Python can write JSON-only exports as-is)
 	FString OutputString;
-	TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&OutputString);
+	TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&OutputString);
 	FJsonSerializer::Serialize(JsonObject.ToSharedRef(), Writer);
 
 	return OutputString;